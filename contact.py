@@ -1,10 +1,54 @@
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
+_clock_cache = threading.local()  # Per-thread cached "now" used while inside clock_tick()
+
+def get_now():
+    """
+    Return the current time. Inside a clock_tick() block the clock is read once and the same
+    value is returned for the rest of the block.
+    """
+    if not getattr(_clock_cache, "active", False):
+        return datetime.now()
+    if _clock_cache.now is None:
+        _clock_cache.now = datetime.now()
+    return _clock_cache.now
+
+def name_key(first_name, last_name):
+    """
+    Build the case-insensitive key used to look contacts up by first and last name.
+    The key is interned, so equal keys are usually the same object and compare by identity.
+    """
+    return sys.intern(f"{first_name.strip()}\0{last_name.strip()}".casefold())
+
+@contextmanager
+def clock_tick():
+    """
+    Treat everything in the block as happening at one instant, e.g. all rows of a CSV import.
+    Nested blocks share the outer block's time.
+    """
+    if getattr(_clock_cache, "active", False):
+        yield
+        return
+    _clock_cache.active = True
+    _clock_cache.now = None
+    try:
+        yield
+    finally:
+        _clock_cache.active = False
+        _clock_cache.now = None
+
 class Contact:
+    # Fixed attribute layout: no per-instance __dict__, so contacts are smaller and field access is faster
+    __slots__ = ("first_name", "last_name", "phone_number", "email", "address", "created_at", "updated_at",
+                 "_first_lower", "_last_lower", "_search_text", "_key", "_display")
+
     def __init__(self, first_name, last_name, phone_number, email=None, address=None):
         """
         Creat a Contact object with first name, last name, phone number, and email and address(optional).
-        The creation and update timestamps are set to the current time.
+        The creation and update timestamps are set to the current time (see get_now).
         
         """
         self.first_name = first_name  
@@ -12,8 +56,14 @@ class Contact:
         self.phone_number = phone_number  
         self.email = email  
         self.address = address  
-        self.created_at = datetime.now()  
-        self.updated_at = datetime.now()  
+        self._first_lower = first_name.lower()  # Cached lowercase names for searching and sorting
+        self._last_lower = last_name.lower()  
+        self._update_search_text()
+        self._key = name_key(first_name, last_name)  # Name index key, see name_key
+        self._display = None  # Cached __str__ result, built on first use
+        now = get_now()
+        self.created_at = now  
+        self.updated_at = now  
 
     def update_contact(self, first_name=None, last_name=None, phone_number=None, email=None, address=None):
         """
@@ -22,21 +72,36 @@ class Contact:
         """
         if first_name:  # If a new first name is provided, update it
             self.first_name = first_name
+            self._first_lower = first_name.lower()
         if last_name:  # If a new last name is provided, update it
             self.last_name = last_name
+            self._last_lower = last_name.lower()
         if phone_number:  # If a new phone number is provided, update it
             self.phone_number = phone_number
+        self._update_search_text()
+        if first_name or last_name:
+            self._key = name_key(self.first_name, self.last_name)
         if email:  # If a new email address is provided, update it
             self.email = email
         if address:  # If a new physical address is provided, update it
             self.address = address
-        self.updated_at = datetime.now()  # Update the last updated timestamp
+        self._display = None  # Fields may have changed, rebuild the display string next time
+        self.updated_at = get_now()  # Update the last updated timestamp
+
+    def _update_search_text(self):
+        """
+        Join the searchable fields into one string so a search needs a single substring test per contact.
+        The NUL separator keeps a query from matching across two fields.
+        """
+        self._search_text = f"{self._first_lower}\0{self._last_lower}\0{self.phone_number}"
 
     def __str__(self):
         """
         Return a string representation of the contact, displaying the contact's name, phone number, 
         email, and address. If email or address is not provided, show 'N/A'.
-        
+        The string is built once and reused until the contact is updated.
         :return: A formatted string representing the contact's details.
         """
-        return f"{self.first_name} {self.last_name}: {self.phone_number} | Email: {self.email or 'N/A'} | Address: {self.address or 'N/A'}"
+        if self._display is None:
+            self._display = f"{self.first_name} {self.last_name}: {self.phone_number} | Email: {self.email or 'N/A'} | Address: {self.address or 'N/A'}"
+        return self._display
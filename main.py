@@ -1,15 +1,8 @@
-import re
-from phonebook import PhoneBook  # Importing the PhoneBook class to manage contacts and operations
+from functools import lru_cache
+from phonebook import PhoneBook, validate_phone_number  # PhoneBook manages contacts; the validator is shared with it
 from contact import Contact      # Importing Contact class to create contact instances
 
-def validate_phone_number(phone_number):
-    """
-    make sure the phone number format match (###) ###-####
-    :return: True if the phone number matches the format, False otherwise
-    """
-    pattern = r"\(\d{3}\) \d{3}-\d{4}"
-    return re.fullmatch(pattern, phone_number) is not None
-
+@lru_cache(maxsize=4096)
 def validate_email(email):
     """
     make sure  the email that user input inculde contains "@" and "."
@@ -96,13 +89,7 @@ def main():
             last_name = input("Enter the last name of the contact to update: ")  # Get contact's last name
             
             # First check if the contact exists using precise first and last name matching
-            contact_found = False
-            for contact in phonebook.contacts:  # Loop through contacts to find a match
-                if contact.first_name.lower() == first_name.lower() and contact.last_name.lower() == last_name.lower():
-                    contact_found = True
-                    break  # Stop searching once we find the contact
-
-            if not contact_found:  # If no contact is found, print message and stop execution
+            if not phonebook.find_contacts_by_name(first_name, last_name):  # If no contact is found, print message and stop execution
                 print(f"No contact found with the name {first_name} {last_name}.")
                 continue  # Return to the menu
             
@@ -134,13 +121,7 @@ def main():
             last_name = input("Enter the last name of the contact to delete: ")  # Get contact's last name
             
             # First check if the contact exists before asking for confirmation
-            contact_found = False
-            for contact in phonebook.contacts:  # Loop through contacts to find a match
-                if contact.first_name.lower() == first_name.lower() and contact.last_name.lower() == last_name.lower():
-                    contact_found = True
-                    break  # Stop searching once we find the contact
-
-            if not contact_found:  # If no contact is found, print message and stop execution
+            if not phonebook.find_contacts_by_name(first_name, last_name):  # If no contact is found, print message and stop execution
                 print(f"No contact found with the name {first_name} {last_name}.")
                 continue  # Return to the menu
             
@@ -1,9 +1,10 @@
+import bisect
 import csv
 import os
 import logging
-import re
-from datetime import datetime
-from contact import Contact
+from datetime import datetime, time
+from functools import lru_cache
+from contact import Contact, clock_tick, name_key
 
 # Set up logging configuration
 logging.basicConfig(
@@ -12,6 +13,36 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+_CSV_BUFFER_SIZE = 1 << 20  # 1 MiB read/write buffer for CSV files, fewer system calls on large files
+_COMPACT_THRESHOLD = 1000  # Rewrite the whole CSV once the change log holds this many operations
+
+_UPDATE_FIELDS = ("first_name", "last_name", "phone_number", "email", "address")  # Contact fields, in CSV column order
+
+@lru_cache(maxsize=4096)
+def validate_phone_number(phone_number):
+    """
+    Check the (###) ###-#### format. Kept at module level so results can be cached across PhoneBook
+    instances, and so main.py can use the same check.
+    :return: True if valid, False otherwise
+    """
+    # Fixed-offset check; the format is rigid enough that a regex is overkill
+    return (len(phone_number) == 14 and phone_number[0] == '(' and phone_number[4] == ')'
+            and phone_number[5] == ' ' and phone_number[9] == '-'
+            and phone_number[1:4].isdecimal() and phone_number[6:9].isdecimal()
+            and phone_number[10:14].isdecimal())
+
+def _contact_row(contact):
+    """
+    Return the contact's fields in CSV column order, with missing values as empty strings (as they read back from a CSV file).
+    """
+    return [getattr(contact, field) or '' for field in _UPDATE_FIELDS]
+
+def _trigrams(text):
+    """
+    Return the set of all 3-character substrings of text.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
 class PhoneBook:
     def __init__(self):
         """
@@ -19,6 +50,16 @@ class PhoneBook:
         """
         self.contacts = []  # List to store Contact objects
         self.filename = os.path.join(os.path.dirname(__file__), 'contacts.csv')  # Set the CSV file path
+        self._sort_keys = []  # Lowercase last names parallel to self.contacts, None if not sorted by last name
+        self._bulk = False  # While True, adds skip sorting/logging and removals are batched (caller finishes up once)
+        self._pending_removals = set()  # ids of contacts removed during bulk mode but still in self.contacts
+        self._name_index = {}  # Casefolded name key (see contact.name_key) -> list of Contact objects with that name
+        self._trigram_index = {}  # 3-character substring of a searchable field -> set of Contact objects containing it
+        self._dirty_ops = []  # Changes since the last save, as rows for the change log (add/remove/update)
+        self._logged_ops = 0  # Number of operations already in the change log on disk
+        self._loading = False  # While True, changes are not recorded (they are already on disk)
+        self._needs_load_marker = False  # True until the first save after load_from_file writes a "load" row
+        self._loaded = False  # True once self.contacts was loaded from (or written to) self.filename
 
     def validate_phone_number(self, phone_number):
         """
@@ -26,8 +67,7 @@ class PhoneBook:
         :param phone_number: Phone number string
         :return: True if valid, False otherwise
         """
-        pattern = r"\(\d{3}\) \d{3}-\d{4}"  # Regular expression for phone number format
-        return re.fullmatch(pattern, phone_number) is not None
+        return validate_phone_number(phone_number)  # Module-level validator, shared with main.py
 
     def add_contact(self, contact):
         """
@@ -38,11 +78,66 @@ class PhoneBook:
         if not self.validate_phone_number(contact.phone_number):  # Validate phone number format
             print("Invalid phone number format. Please use (###) ###-####.")
             return  # If invalid, stop the function
-        self.contacts.append(contact)  # Add contact to the list
-        logging.info(f"Added contact: {contact.first_name} {contact.last_name}, Phone: {contact.phone_number}")
-        
-        # Automatically sort contacts by last name after adding
-        self.sort_contacts(key="last_name")
+        self._add_unchecked(contact)
+        self._record_add(contact)
+        if not (self._bulk or self._loading):  # Bulk loads log a single summary line instead
+            logging.info(f"Added contact: {contact.first_name} {contact.last_name}, Phone: {contact.phone_number}")
+
+    def _add_unchecked(self, contact):
+        """
+        Add a contact whose phone number has already been validated, keeping the sort order and name index in sync.
+        :param contact: Contact object to be added
+        """
+        if self._bulk:  # Bulk load: the caller sorts once when it is done
+            self.contacts.append(contact)
+        elif self._sort_keys is None:  # Not currently ordered by last name, so do a full sort
+            self.contacts.append(contact)
+            self.sort_contacts(key="last_name")
+        else:
+            # Already sorted by last name: insert in place instead of re-sorting everything
+            sort_key = contact._last_lower
+            index = bisect.bisect_right(self._sort_keys, sort_key)
+            self._sort_keys.insert(index, sort_key)
+            self.contacts.insert(index, contact)
+        self._index_contact(contact)
+
+    def _record(self, op):
+        """
+        Remember a change so save_to_file can append it to the change log.
+        :param op: Change log row, starting with "add", "remove" or "update"
+        """
+        if not self._loading:
+            self._dirty_ops.append(op)
+
+    def _record_add(self, contact):
+        """
+        Record that a contact was added.
+        """
+        self._record(["add"] + _contact_row(contact))
+
+    def _index_contact(self, contact):
+        """
+        Register a contact in the name and search indexes.
+        """
+        self._name_index.setdefault(contact._key, []).append(contact)
+        self._index_trigrams(contact)
+
+    def _index_trigrams(self, contact):
+        """
+        Add a contact to the trigram search index.
+        """
+        for trigram in _trigrams(contact._search_text):
+            self._trigram_index.setdefault(trigram, set()).add(contact)
+
+    def _unindex_trigrams(self, contact):
+        """
+        Remove a contact from the trigram search index.
+        """
+        for trigram in _trigrams(contact._search_text):
+            contacts = self._trigram_index[trigram]
+            contacts.discard(contact)
+            if not contacts:
+                del self._trigram_index[trigram]
 
     def sort_contacts(self, key="first_name"):
         """
@@ -50,24 +145,53 @@ class PhoneBook:
         :param key: Sorting criterion (default is "first_name")
         """
         if key == "first_name":
-            self.contacts = sorted(self.contacts, key=lambda contact: contact.first_name.lower())
+            self.contacts = sorted(self.contacts, key=lambda contact: contact._first_lower)
+            self._sort_keys = None
         elif key == "last_name":
-            self.contacts = sorted(self.contacts, key=lambda contact: contact.last_name.lower())
+            self.contacts = sorted(self.contacts, key=lambda contact: contact._last_lower)
+            self._sort_keys = [contact._last_lower for contact in self.contacts]
         logging.info(f"Contacts automatically sorted by {key}.")
 
     def remove_contact_by_name(self, first_name, last_name):
         """
         Remove a contact from the phonebook by matching first and last name.
+        :return: True if any contact was removed, False otherwise
         """
-        original_count = len(self.contacts)  # Keep track of original contact count
         first_name, last_name = first_name.strip(), last_name.strip()  # Clean up input
-        # Remove contacts that match the given first and last name
-        self.contacts = [contact for contact in self.contacts if contact.first_name.strip().lower() != first_name.lower() or contact.last_name.strip().lower() != last_name.lower()]
-        if len(self.contacts) < original_count:  # If a contact was removed
+        if self._remove_by_name(first_name, last_name):  # If a contact was removed
+            self._record(["remove", first_name, last_name])
             logging.info(f"Removed contact: {first_name} {last_name}")
             print(f"Contact {first_name} {last_name} deleted successfully.")
-        else:  # If no contact was removed
-            logging.warning(f"Contact {first_name} {last_name} not found.")
+            return True
+        # If no contact was removed
+        logging.warning(f"Contact {first_name} {last_name} not found.")
+        return False
+
+    def _remove_by_name(self, first_name, last_name):
+        """
+        Remove every contact matching the given first and last name, without logging or printing.
+        :return: List of removed contacts
+        """
+        removed = self._name_index.pop(name_key(first_name, last_name), None)
+        if not removed:
+            return []
+        for contact in removed:
+            self._unindex_trigrams(contact)
+        self._pending_removals.update(id(contact) for contact in removed)
+        if not self._bulk:  # In bulk mode the list is filtered once when the caller is done
+            self._flush_removals()
+        return removed
+
+    def _flush_removals(self):
+        """
+        Drop every contact removed from the indexes from self.contacts in a single pass.
+        """
+        if not self._pending_removals:
+            return
+        self.contacts = [contact for contact in self.contacts if id(contact) not in self._pending_removals]
+        self._pending_removals = set()
+        if self._sort_keys is not None:
+            self._sort_keys = [contact._last_lower for contact in self.contacts]
 
     def batch_delete(self, csv_file):
         """
@@ -76,18 +200,21 @@ class PhoneBook:
         """
         try:
             not_found_contacts = []  # List to track contacts that were not found
-            with open(csv_file, newline='', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip the header row (e.g., first_name, last_name, etc.)
-                
-                for row in reader:
-                    if len(row) >= 2:
-                        first_name, last_name = row[0].strip(), row[1].strip()  # Get first and last name from CSV
-                        original_count = len(self.contacts)
-                        self.remove_contact_by_name(first_name, last_name)  # Try to remove the contact
-                        if len(self.contacts) == original_count:
-                            not_found_contacts.append(f"{first_name} {last_name}")  # If not found, add to not_found list
-                logging.info(f"Batch delete completed from {csv_file}")
+            self._bulk = True  # Look up and unindex each row now, filter the contact list once at the end
+            try:
+                with open(csv_file, newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as file:
+                    reader = csv.reader(file)
+                    next(reader)  # Skip the header row (e.g., first_name, last_name, etc.)
+
+                    for row in reader:
+                        if len(row) >= 2:
+                            first_name, last_name = row[0].strip(), row[1].strip()  # Get first and last name from CSV
+                            if not self.remove_contact_by_name(first_name, last_name):  # Try to remove the contact
+                                not_found_contacts.append(f"{first_name} {last_name}")  # If not found, add to not_found list
+            finally:
+                self._bulk = False
+                self._flush_removals()
+            logging.info(f"Batch delete completed from {csv_file}")
 
             if not_found_contacts:  # If some contacts were not found
                 print(f"The following contacts were not found and could not be deleted: {', '.join(not_found_contacts)}")
@@ -105,25 +232,36 @@ class PhoneBook:
         """
         try:
             invalid_contacts = []  # List to record contacts with invalid phone numbers
-            with open(csv_file, newline='', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if len(row) >= 3:  # Ensure there are enough columns for first name, last name, and phone number
-                        first_name, last_name, phone_number = row[0], row[1], row[2]
-                        email = row[3] if len(row) > 3 else None
-                        address = row[4] if len(row) > 4 else None
-                        contact = Contact(first_name, last_name, phone_number, email, address)
-                        if not self.validate_phone_number(phone_number):  # Validate phone number format
-                            invalid_contacts.append(f"{first_name} {last_name}: {phone_number}")
-                            continue  # Skip invalid contacts
-                        self.add_contact(contact)  # Add valid contact
+            new_contacts = []  # Valid contacts, added in one go once the whole file is read
+            with open(csv_file, newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as file:
+                # Ensure there are enough columns for first name, last name, and phone number
+                rows = [row for row in csv.reader(file) if len(row) >= 3]
+            # Validate the whole phone number column in one pass before building any contacts
+            valid_phones = list(map(self.validate_phone_number, [row[2] for row in rows]))
+            # clock_tick: every imported contact gets the same timestamp from a single clock read
+            with clock_tick():
+                for row, valid_phone in zip(rows, valid_phones):
+                    first_name, last_name, phone_number = row[0], row[1], row[2]
+                    if not valid_phone:  # Skip contacts with an invalid phone number format
+                        invalid_contacts.append(f"{first_name} {last_name}: {phone_number}")
+                        continue
+                    email = row[3] if len(row) > 3 else None
+                    address = row[4] if len(row) > 4 else None
+                    new_contacts.append(Contact(first_name, last_name, phone_number, email, address))
+            if new_contacts:
+                # Rows are already validated, so skip add_contact and sort only once
+                self.contacts.extend(new_contacts)
+                for contact in new_contacts:
+                    self._index_contact(contact)
+                    self._record_add(contact)
+                self.sort_contacts(key="last_name")
             if invalid_contacts:  # If some contacts had invalid phone numbers
                 print(f"❌ The following contacts have invalid phone numbers and were not imported:")
                 for contact in invalid_contacts:
                     print(contact)
             else:  # All contacts imported successfully
                 print(f"✅ Batch import from {csv_file} completed successfully.")
-            logging.info(f"Batch import from {csv_file} completed with {len(invalid_contacts)} invalid contacts.")
+            logging.info(f"Batch import from {csv_file} completed: imported {len(new_contacts)} contacts, {len(invalid_contacts)} invalid contacts.")
         except FileNotFoundError:
             logging.error(f"File {csv_file} not found.")
             print(f"❌ File {csv_file} not found.")
@@ -133,12 +271,27 @@ class PhoneBook:
         Search for contacts by first name, last name, or phone number.
         """
         query = query.strip().lower()  # Clean up and normalize search query
-        result = [
-            contact for contact in self.contacts
-            if query in contact.first_name.lower() or
-               query in contact.last_name.lower() or
-               query in contact.phone_number
-        ]
+        candidates = self.contacts
+        if len(query) >= 3:
+            # Only contacts that contain every trigram of the query can match
+            matching = None
+            for trigram in _trigrams(query):
+                contacts = self._trigram_index.get(trigram)
+                if not contacts:
+                    matching = set()
+                    break
+                matching = set(contacts) if matching is None else matching & contacts
+            # Keep phonebook order; skip the scan entirely when nothing can match
+            candidates = [contact for contact in self.contacts if contact in matching] if matching else []
+        if "\0" in query:  # Could span the field separator in _search_text, so check each field
+            result = [
+                contact for contact in candidates
+                if query in contact._first_lower or
+                   query in contact._last_lower or
+                   query in contact.phone_number
+            ]
+        else:
+            result = [contact for contact in candidates if query in contact._search_text]
         logging.info(f"Searched for: {query}, Found: {len(result)} contact(s)")
         return result  # Return the list of matched contacts
 
@@ -151,17 +304,10 @@ class PhoneBook:
             # Convert input strings to date objects
             start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
             end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-            result = []
-            for contact in self.contacts:
-                contact_created_at = contact.created_at.date()  # Get only the date part of created_at
-                if start_date <= contact_created_at <= end_date:  # Check if within date range
-                    result.append(contact)
-            if result:  # If there are results
-                print(f"📅 Found {len(result)} contact(s) in the given date range:")
-                for contact in result:
-                    print(contact)
-            else:
-                print(f"❌ No contacts found between {start_date} and {end_date}")
+            # Compare created_at against datetime bounds directly instead of calling .date() per contact
+            start_at = datetime.combine(start_date, time.min)
+            end_at = datetime.combine(end_date, time.max)
+            result = [contact for contact in self.contacts if start_at <= contact.created_at <= end_at]
             logging.info(f"Filtered contacts from {start_date} to {end_date}, Found: {len(result)} contact(s)")
             return result
         except ValueError:  # If the date format is invalid
@@ -173,21 +319,73 @@ class PhoneBook:
         Update contact information based on first and last name.
 
         """
-        # Find the matching contact
-        for contact in self.contacts:
-            if contact.first_name.lower() == first_name.lower() and contact.last_name.lower() == last_name.lower():
-                # Perform the update only if contact is found
-                contact.update_contact(**new_contact_info)
-                logging.info(f"Updated contact: {contact.first_name} {contact.last_name}")
-                print(f"Contact {first_name} {last_name} updated successfully.")
-                return
-        
+        # Find the matching contact and perform the update only if it is found
+        contact = self._first_by_name(first_name, last_name)
+        if contact is not None:
+            # Log the contact's full old details so replay can tell apart contacts that share a name
+            old_row = _contact_row(contact)
+            self._update_contact(contact, new_contact_info)
+            self._record(["update"] + old_row + [new_contact_info.get(field) for field in _UPDATE_FIELDS])
+            logging.info(f"Updated contact: {contact.first_name} {contact.last_name}")
+            print(f"Contact {first_name} {last_name} updated successfully.")
+            return
+
         # If no contact is found, print a message and stop further execution
         logging.warning(f"Tried to update contact but no contact found with name: {first_name} {last_name}")
         print(f"No contact found with the name {first_name} {last_name}.")
 
 
 
+    def _first_by_name(self, first_name, last_name):
+        """
+        Find the contact with the given name that is listed first in self.contacts.
+        :return: The matching contact, or None if no contact matched
+        """
+        matches = self._name_index.get(name_key(first_name, last_name))
+        if not matches:
+            return None
+        if len(matches) == 1:
+            return matches[0]
+        # Several contacts share the name: index order can differ from list order, so scan the list
+        match_ids = {id(contact) for contact in matches}
+        return next(contact for contact in self.contacts if id(contact) in match_ids)
+
+    def _find_by_row(self, row):
+        """
+        Find the first listed contact whose fields all equal row (as produced by _contact_row).
+        This is the contact update_contact_by_name picked when the row was logged.
+        :return: The matching contact, or None if no contact matched
+        """
+        matches = [contact for contact in self._name_index.get(name_key(row[0], row[1]), []) if _contact_row(contact) == row]
+        if len(matches) <= 1:
+            return matches[0] if matches else None
+        match_ids = {id(contact) for contact in matches}
+        return next(contact for contact in self.contacts if id(contact) in match_ids)
+
+    def _update_contact(self, contact, new_contact_info):
+        """
+        Apply new_contact_info to a contact and keep the indexes in sync.
+        """
+        key = contact._key
+        self._unindex_trigrams(contact)  # Searchable fields may change
+        contact.update_contact(**new_contact_info)
+        self._index_trigrams(contact)
+        if contact._key != key:  # Name changed, so move the contact to its new index entry
+            matches = self._name_index[key]
+            matches.remove(contact)
+            if not matches:
+                del self._name_index[key]
+            self._name_index.setdefault(contact._key, []).append(contact)
+        if new_contact_info.get("last_name"):  # Order by last name may no longer hold
+            self._sort_keys = None
+
+    def find_contacts_by_name(self, first_name, last_name):
+        """
+        Find contacts whose first and last name match (case-insensitive).
+        :return: List of matching contacts, empty if none
+        """
+        return list(self._name_index.get(name_key(first_name, last_name), []))
+
     def display_contacts(self):
         """
         Display all contacts in the phonebook.
@@ -197,29 +395,106 @@ class PhoneBook:
         for contact in self.contacts:  # Loop through and display all contacts
             print(contact)
 
+    def _ops_log_filename(self):
+        """
+        Path of the change log that sits next to the contacts CSV file.
+        """
+        return self.filename + '.log'
+
     def save_to_file(self):
         """
-        Save all contacts to the CSV file.
+        Save changes since the last save by appending them to the change log.
+        The whole CSV file is rewritten (see compact) instead when it does not exist yet, when the log has grown
+        large, or when this phonebook never loaded the file (its contacts then replace the file's, as before).
+        """
+        if (not self._loaded or not os.path.exists(self.filename)
+                or self._logged_ops + len(self._dirty_ops) >= _COMPACT_THRESHOLD):
+            self.compact()
+            return
+        if self._dirty_ops:
+            ops = self._dirty_ops
+            if self._needs_load_marker:
+                # These changes were made after load_from_file sorted the contacts; replay has to sort at the same point
+                ops = [["load"]] + ops
+            with open(self._ops_log_filename(), 'a', newline='', buffering=_CSV_BUFFER_SIZE) as file:  # Append to the change log
+                csv.writer(file).writerows(ops)
+            self._logged_ops += len(ops)
+            self._dirty_ops = []
+            self._needs_load_marker = False
+        logging.info("Contacts saved to file.")  # Log that contacts were saved
+
+    def compact(self):
+        """
+        Rewrite the CSV file with all contacts and clear the change log.
         """
-        with open(self.filename, 'w', newline='') as file:  # Open CSV file for writing
+        with open(self.filename, 'w', newline='', buffering=_CSV_BUFFER_SIZE) as file:  # Open CSV file for writing
             writer = csv.writer(file)
             for contact in self.contacts:  # Write each contact's details as a new row
-                writer.writerow([contact.first_name, contact.last_name, contact.phone_number, contact.email, contact.address])
-        logging.info("Contacts saved to file.")  # Log that contacts were saved
+                writer.writerow(_contact_row(contact))
+        if os.path.exists(self._ops_log_filename()):
+            os.remove(self._ops_log_filename())  # Everything in the log is now in the CSV file
+        self._dirty_ops = []
+        self._logged_ops = 0
+        self._needs_load_marker = False  # The CSV file now holds the contacts in their current order
+        self._loaded = True  # Later saves can append to the log on top of what was just written
+        logging.info("Contacts saved to file (compacted).")
 
     def load_from_file(self):
         """
-        Load contacts from the CSV file into the phonebook.
+        Load contacts from the CSV file into the phonebook, then apply the change log on top.
+        """
+        original_count = len(self.contacts)
+        self._loading = True  # These contacts are already on disk, so don't record them as changes
+        try:
+            with clock_tick():  # One timestamp for all loaded rows
+                self._bulk = True  # Append CSV rows in file order; the change log and final sort order them
+                try:
+                    with open(self.filename, 'r', buffering=_CSV_BUFFER_SIZE) as file:  # Open CSV file for reading
+                        reader = csv.reader(file)
+                        for row in reader:
+                            if len(row) >= 3:  # Ensure row has at least first name, last name, and phone number
+                                contact = Contact(row[0], row[1], row[2], email=row[3] if len(row) > 3 else None, address=row[4] if len(row) > 4 else None)
+                                self.add_contact(contact)  # Add contact to phonebook
+                except FileNotFoundError:  # If the CSV file is not found
+                    logging.warning(f"No contacts found in {self.filename}. Starting with an empty phone book.")
+                    print(f"No contacts found in {self.filename}. Starting with an empty phone book.")  # Print message to user
+                finally:
+                    self._bulk = False
+                    self._sort_keys = None  # File order, not necessarily sorted
+                # Replay through the normal add/remove/update paths so the order matches the sessions that wrote the log
+                self._replay_ops_log()
+        finally:
+            self._loading = False
+            self.sort_contacts(key="last_name")
+        self._needs_load_marker = True
+        self._loaded = True
+        logging.info(f"Loaded {len(self.contacts) - original_count} contacts from file.")  # Log that contacts were loaded
+
+    def _replay_ops_log(self):
+        """
+        Apply the operations saved in the change log, in order.
+        A "load" row marks where a session loaded the file, which sorted the contacts by last name.
         """
         try:
-            with open(self.filename, 'r') as file:  # Open CSV file for reading
-                reader = csv.reader(file)
-                for row in reader:
-                    if len(row) >= 3:  # Ensure row has at least first name, last name, and phone number
-                        contact = Contact(row[0], row[1], row[2], email=row[3] if len(row) > 3 else None, address=row[4] if len(row) > 4 else None)
-                        self.add_contact(contact)  # Add contact to phonebook
-            logging.info("Contacts loaded from file.")  # Log that contacts were loaded
-        except FileNotFoundError:  # If the CSV file is not found
-            logging.warning(f"No contacts found in {self.filename}. Starting with an empty phone book.")
-            print(f"No contacts found in {self.filename}. Starting with an empty phone book.")  # Print message to user
+            with open(self._ops_log_filename(), 'r', newline='', buffering=_CSV_BUFFER_SIZE) as file:
+                for op in csv.reader(file):
+                    if not op:
+                        continue
+                    if op[0] == "load" and len(op) == 1:
+                        self.sort_contacts(key="last_name")
+                    elif op[0] == "add" and len(op) == 6:
+                        self.add_contact(Contact(op[1], op[2], op[3], email=op[4], address=op[5]))
+                    elif op[0] == "remove" and len(op) == 3:
+                        self._remove_by_name(op[1], op[2])
+                    elif op[0] == "update" and len(op) == 1 + 2 * len(_UPDATE_FIELDS):
+                        old_row, new_values = op[1:1 + len(_UPDATE_FIELDS)], op[1 + len(_UPDATE_FIELDS):]
+                        contact = self._find_by_row(old_row)
+                        if contact is not None:
+                            self._update_contact(contact, {field: value or None for field, value in zip(_UPDATE_FIELDS, new_values)})
+                    else:
+                        logging.warning(f"Skipped malformed change log row: {op}")
+                        continue
+                    self._logged_ops += 1
+        except FileNotFoundError:  # No changes since the CSV file was last written
+            pass
 
@@ -0,0 +1,169 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from contact import Contact
+from phonebook import PhoneBook
+
+
+class PhoneBookTest(unittest.TestCase):
+    def setUp(self):
+        self.phonebook = PhoneBook()
+        # Keep the success/failure messages printed by PhoneBook out of the test output
+        self._quiet = contextlib.redirect_stdout(io.StringIO())
+        self._quiet.__enter__()
+
+    def tearDown(self):
+        self._quiet.__exit__(None, None, None)
+
+    def test_update_duplicate_name_changes_first_listed_contact(self):
+        """
+        When several contacts share a name, update changes the one listed first, even after a rename.
+        """
+        self.phonebook.add_contact(Contact("Ann", "Smith", "(111) 111-1111"))
+        self.phonebook.add_contact(Contact("Ann", "Adams", "(222) 222-2222"))
+        self.phonebook.update_contact_by_name("Ann", "Adams", {"last_name": "Smith"})
+        self.phonebook.update_contact_by_name("Ann", "Smith", {"phone_number": "(999) 999-9999"})
+        self.assertEqual([contact.phone_number for contact in self.phonebook.contacts],
+                         ["(999) 999-9999", "(111) 111-1111"])
+
+    def test_search_follows_updates(self):
+        """
+        Search results reflect updated names and phone numbers, not the old ones.
+        """
+        self.phonebook.add_contact(Contact("Ann", "Smith", "(111) 111-1111"))
+        self.phonebook.add_contact(Contact("Bob", "Jones", "(222) 222-2222"))
+        self.phonebook.update_contact_by_name("Ann", "Smith", {"last_name": "Walker", "phone_number": "(333) 333-3333"})
+        self.assertEqual(self.phonebook.search_contact("smith"), [])
+        self.assertEqual(self.phonebook.search_contact("111"), [])
+        self.assertEqual([c.last_name for c in self.phonebook.search_contact("WALK")], ["Walker"])
+        self.assertEqual([c.last_name for c in self.phonebook.search_contact("333-3")], ["Walker"])
+        self.assertEqual([c.last_name for c in self.phonebook.search_contact("jon")], ["Jones"])
+
+    def test_search_after_remove(self):
+        """
+        Removed contacts are no longer found, while others with overlapping names still are.
+        """
+        self.phonebook.add_contact(Contact("Ann", "Smith", "(111) 111-1111"))
+        self.phonebook.add_contact(Contact("Anna", "Smithers", "(222) 222-2222"))
+        self.phonebook.remove_contact_by_name("ann", "smith")
+        self.assertEqual([c.first_name for c in self.phonebook.search_contact("smith")], ["Anna"])
+        self.assertEqual(self.phonebook.search_contact("111"), [])
+        self.phonebook.remove_contact_by_name("Anna", "Smithers")
+        self.assertEqual(self.phonebook.search_contact("smith"), [])
+        self.assertEqual(self.phonebook.search_contact("an"), [])  # Short queries scan the list instead
+
+    def test_search_does_not_match_across_fields(self):
+        """
+        A 3-character query made of the end of one field and the start of the next does not match.
+        """
+        self.phonebook.add_contact(Contact("Ann", "Smith", "(111) 111-1111"))
+        self.assertEqual(self.phonebook.search_contact("nsm"), [])
+        self.assertEqual(self.phonebook.search_contact("n\0s"), [])  # Same query with the field separator in it
+        self.assertEqual(self.phonebook.search_contact("h(1"), [])
+        self.assertEqual(len(self.phonebook.search_contact("ann")), 1)
+
+    def test_batch_delete_repeated_and_missing_names(self):
+        """
+        Batch delete removes every contact with a listed name once, reports missing names, and keeps search in sync.
+        """
+        self.phonebook.add_contact(Contact("Ann", "Smith", "(111) 111-1111"))
+        self.phonebook.add_contact(Contact("Ann", "Smith", "(222) 222-2222"))
+        self.phonebook.add_contact(Contact("Bob", "Jones", "(333) 333-3333"))
+        self.phonebook.add_contact(Contact("Cat", "Adams", "(444) 444-4444"))
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "delete.csv")
+            with open(csv_file, "w", newline="", encoding="utf-8") as file:
+                file.write("first_name,last_name\nann,SMITH\nNo,Body\nAnn,Smith\nBob,Jones\n")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.phonebook.batch_delete(csv_file)
+        self.assertIn("could not be deleted: No Body, Ann Smith", output.getvalue())
+        self.assertEqual([c.first_name for c in self.phonebook.contacts], ["Cat"])
+        self.assertEqual(self.phonebook.find_contacts_by_name("Ann", "Smith"), [])
+        self.assertEqual(self.phonebook.search_contact("smith"), [])
+        self.assertEqual(self.phonebook.search_contact("jon"), [])
+        self.assertEqual([c.first_name for c in self.phonebook.search_contact("ada")], ["Cat"])
+        # The list is usable again afterwards: new contacts are still inserted in order
+        self.phonebook.add_contact(Contact("Dan", "Zed", "(555) 555-5555"))
+        self.phonebook.add_contact(Contact("Eve", "Baker", "(666) 666-6666"))
+        self.assertEqual([c.last_name for c in self.phonebook.contacts], ["Adams", "Baker", "Zed"])
+
+    def test_reload_replays_updates_to_duplicate_names(self):
+        """
+        Saving to the change log and loading again gives the same contacts, even when updates target shared names.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.phonebook.filename = os.path.join(directory, "contacts.csv")
+            self.phonebook.add_contact(Contact("Ann", "Smith", "(111) 111-1111"))
+            self.phonebook.save_to_file()  # First save writes the CSV file, later ones append to the change log
+            self.phonebook.add_contact(Contact("Ann", "Smith", "(222) 222-2222", email="ann@example.com"))
+            self.phonebook.add_contact(Contact("Ann", "Adams", "(333) 333-3333"))
+            self.phonebook.update_contact_by_name("Ann", "Adams", {"last_name": "Smith"})
+            self.phonebook.update_contact_by_name("ann", "SMITH", {"phone_number": "(999) 999-9999"})
+            self.phonebook.update_contact_by_name("Ann", "Smith", {"address": "Ottawa, ON"})
+            self.phonebook.save_to_file()
+            self.assertTrue(os.path.exists(self.phonebook.filename + ".log"))
+
+            self.assertEqual(self._rows(self._reload()), self._rows(self.phonebook))
+
+    def test_reload_keeps_order_after_rename_into_existing_last_name(self):
+        """
+        A contact renamed into a last name that is already used keeps its place in the list after a reload.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.phonebook.filename = os.path.join(directory, "contacts.csv")
+            open(self.phonebook.filename, "w").close()  # Existing, empty CSV file
+            self.phonebook.load_from_file()
+            self.phonebook.add_contact(Contact("ann", "Adams", "(111) 111-1111"))
+            self.phonebook.add_contact(Contact("Zed", "Ad", "(222) 222-2222"))
+            self.phonebook.update_contact_by_name("Zed", "Ad", {"last_name": "Adams"})
+            self.assertEqual([c.first_name for c in self.phonebook.contacts], ["Zed", "ann"])
+            self.phonebook.save_to_file()
+
+            reloaded = self._reload()
+            self.assertEqual(self._rows(reloaded), self._rows(self.phonebook))
+
+            # A second session starts from the reloaded order, so its changes must replay from there too
+            reloaded.update_contact_by_name("ann", "adams", {"phone_number": "(333) 333-3333"})
+            reloaded.add_contact(Contact("Bob", "Adams", "(444) 444-4444"))
+            reloaded.save_to_file()
+            self.assertEqual(self._rows(self._reload()), self._rows(reloaded))
+
+    def test_save_without_load_replaces_file(self):
+        """
+        A phonebook that never loaded the file overwrites it on save instead of adding to the old contents.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.phonebook.filename = os.path.join(directory, "contacts.csv")
+            self.phonebook.add_contact(Contact("Old", "Contact", "(111) 111-1111"))
+            self.phonebook.save_to_file()
+
+            fresh = PhoneBook()
+            fresh.filename = self.phonebook.filename
+            fresh.add_contact(Contact("New", "Contact", "(222) 222-2222"))
+            fresh.save_to_file()
+            self.assertFalse(os.path.exists(fresh.filename + ".log"))
+            self.assertEqual(self._rows(self._reload()), self._rows(fresh))
+
+    def _reload(self):
+        """
+        Load a fresh PhoneBook from the same CSV file (and change log) as self.phonebook.
+        """
+        reloaded = PhoneBook()
+        reloaded.filename = self.phonebook.filename
+        reloaded.load_from_file()
+        return reloaded
+
+    @staticmethod
+    def _rows(phonebook):
+        """
+        Contact details in list order, the order update_contact_by_name uses to pick among duplicates.
+        """
+        return [(c.first_name, c.last_name, c.phone_number, c.email or "", c.address or "") for c in phonebook.contacts]
+
+
+if __name__ == "__main__":
+    unittest.main()